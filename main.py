@@ -1,16 +1,21 @@
 from __future__ import annotations
+import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
-from utils import (_safe_str, _safe_int, _limit)
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+from utils import (_str_col, _int_col, _reachable)
+from tbox import build_tbox
 
 from owlready2 import (
-    get_ontology,
+    World,
+    default_world,
     Thing,
-    DataProperty,
-    ObjectProperty,
-    FunctionalProperty,
-    TransitiveProperty,
-    sync_reasoner, ConstrainedDatatype,
+    sync_reasoner_pellet,
 )
 
 # constants
@@ -34,350 +39,277 @@ CSV = {
     "stop_times": DATA_DIR / "stop_times.csv",
 }
 
-OUT_FILE = "Output/transport.owl"
-ONTO_IRI = "http://example.org/transport.owl"
+# Only the columns used below are parsed; ids and names are read as strings
+CSV_COLUMNS = {
+    "stops": ["stop_id", "stop_name", "location_type"],
+    "routes": ["route_id", "route_short_name", "route_type"],
+    "trips": ["trip_id", "route_id", "trip_headsign", "wheelchair_accessible"],
+    "transfers": ["from_stop_id", "to_stop_id", "min_transfer_time"],
+    "pathways": ["pathway_id", "from_stop_id", "to_stop_id", "pathway_mode", "is_bidirectional"],
+    "stop_times": ["trip_id", "stop_id"],
+}
 
+# Ids every row needs; the other GTFS columns above are optional and may be absent from a feed
+REQUIRED_COLUMNS = {
+    "stops": ["stop_id"],
+    "routes": ["route_id"],
+    "trips": ["trip_id", "route_id"],
+    "transfers": ["from_stop_id", "to_stop_id"],
+    "pathways": ["pathway_id", "from_stop_id", "to_stop_id"],
+    "stop_times": ["trip_id", "stop_id"],
+}
 
-def main() -> None:
-    stops_df = _limit(pd.read_csv(CSV["stops"]), MAX_STOPS)
-    routes_df = _limit(pd.read_csv(CSV["routes"]), MAX_ROUTES)
-    trips_df = _limit(pd.read_csv(CSV["trips"]), MAX_TRIPS)
-    transfers_df = _limit(pd.read_csv(CSV["transfers"]), MAX_TRANSFERS)
-    pathways_df = _limit(pd.read_csv(CSV["pathways"]), MAX_PATHWAYS)
-    stop_times_df = _limit(pd.read_csv(CSV["stop_times"]), MAX_STOP_TIMES)
+STR_COLUMNS = {
+    "stop_id", "stop_name", "route_id", "route_short_name", "trip_id", "trip_headsign",
+    "from_stop_id", "to_stop_id", "pathway_id",
+}
 
-    onto = get_ontology(ONTO_IRI)
+# pyarrow's multithreaded parser is used for uncapped reads when installed; it does not
+# support nrows, so capped reads stay on the C engine
+FULL_READ_ENGINE = "pyarrow" if pyarrow is not None else "c"
+
+OUT_FILE = Path("Output/transport.owl")
+# owlready2 save format -> output file suffix; N-Triples is the much faster writer
+SAVE_FORMATS = {"rdfxml": ".owl", "ntriples": ".nt"}
+# rows per stop_times chunk; only the rows matching the sampled trips/stops are kept
+STOP_TIMES_CHUNK = 100_000
+
+
+def _project(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    # missing optional columns come back all-NA, so _str_col/_int_col turn them into ""/None
+    missing = [c for c in REQUIRED_COLUMNS[name] if c not in df.columns]
+    if missing:
+        raise ValueError(f"{CSV[name].name} is missing required column(s): {', '.join(missing)}")
+    return df.reindex(columns=CSV_COLUMNS[name])
+
+
+def _read_csv(name: str, n: int | None, chunksize: int | None = None):
+    cols = CSV_COLUMNS[name]
+    dtype = {c: "string" for c in cols if c in STR_COLUMNS}
+    engine = FULL_READ_ENGINE if n is None and chunksize is None else "c"
+    if engine == "c":
+        usecols = lambda c: c in cols  # noqa: E731
+    else:
+        # pyarrow does not accept a callable projection, so intersect with the header instead
+        header = pd.read_csv(CSV[name], nrows=0).columns
+        usecols = [c for c in cols if c in header]
+    data = pd.read_csv(CSV[name], nrows=n, chunksize=chunksize, usecols=usecols, dtype=dtype, engine=engine)
+    if chunksize is None:
+        return _project(name, data)
+    return (_project(name, chunk) for chunk in data)
+
+
+def main(reason: bool = False, fmt: str = "ntriples", db_file: str | None = None) -> None:
+    # Fail fast if owlready2 would fall back to its pure-Python parser/serializer
+    try:
+        import owlready2_optimized  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "owlready2 was installed without its compiled owlready2_optimized module; "
+            "reinstall owlready2 from a wheel or with Cython available"
+        ) from None
+    caps = {
+        "stops": MAX_STOPS,
+        "routes": MAX_ROUTES,
+        "trips": MAX_TRIPS,
+        "transfers": MAX_TRANSFERS,
+        "pathways": MAX_PATHWAYS,
+    }
+    # The reads are independent and pandas' C parser releases the GIL, so run them concurrently.
+    # stop_times is streamed later, once the trips and stops it is filtered against exist.
+    with ThreadPoolExecutor(max_workers=len(caps)) as ex:
+        futs = {name: ex.submit(_read_csv, name, n) for name, n in caps.items()}
+        dfs = {name: fut.result() for name, fut in futs.items()}
+
+    stops_df = dfs["stops"]
+    routes_df = dfs["routes"]
+    trips_df = dfs["trips"]
+    transfers_df = dfs["transfers"]
+    pathways_df = dfs["pathways"]
+
+    # An on-disk SQLite world keeps the quadstore out of RAM at some write cost
+    if db_file:
+        # always build from an empty quadstore, otherwise the previous run's ABox is merged in
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            Path(db_file + suffix).unlink(missing_ok=True)
+    # owlready2 keeps the whole build in one transaction until world.save(). Since the file is
+    # recreated above, a crash mid-build only loses a file the next run deletes anyway, so the
+    # rollback journal can stay in memory.
+    world = World(filename=db_file, journal_mode="MEMORY") if db_file else default_world
+    onto = build_tbox(world)
+    Stop, Route, Trip, Transfer, Pathway = onto.Stop, onto.Route, onto.Trip, onto.Transfer, onto.Pathway
 
+    # Create Individuals from CSV
+    # Normalize the used columns once per DataFrame instead of per cell in the loops
+    for col in ("stop_id", "stop_name"):
+        stops_df[col] = _str_col(stops_df[col])
+    stops_df["location_type"] = _int_col(stops_df["location_type"])
+    stops_df["_iri"] = "stop_" + stops_df["stop_id"]
+
+    for col in ("route_id", "route_short_name"):
+        routes_df[col] = _str_col(routes_df[col])
+    routes_df["route_type"] = _int_col(routes_df["route_type"])
+    routes_df["_iri"] = "route_" + routes_df["route_id"]
+
+    for col in ("trip_id", "route_id", "trip_headsign"):
+        trips_df[col] = _str_col(trips_df[col])
+    trips_df["wheelchair_accessible"] = _int_col(trips_df["wheelchair_accessible"])
+    trips_df["_iri"] = "trip_" + trips_df["trip_id"]
+
+    for col in ("from_stop_id", "to_stop_id"):
+        transfers_df[col] = _str_col(transfers_df[col])
+    transfers_df["min_transfer_time"] = _int_col(transfers_df["min_transfer_time"])
+    transfers_df["_iri"] = (
+        "transfer_" + transfers_df["from_stop_id"] + "_" + transfers_df["to_stop_id"]
+        + "_" + transfers_df.index.astype(str)
+    )
+
+    for col in ("pathway_id", "from_stop_id", "to_stop_id"):
+        pathways_df[col] = _str_col(pathways_df[col])
+    for col in ("pathway_mode", "is_bidirectional"):
+        pathways_df[col] = _int_col(pathways_df[col])
+    pathways_df["_iri"] = "pathway_" + pathways_df["pathway_id"]
+
+    # Build all individuals in one ontology context
     with onto:
-        class Stop(Thing):
-            pass
-
-        class Route(Thing):
-            pass
-
-        class Trip(Thing):
-            pass
-
-        class Transfer(Thing):
-            pass
-
-        class Pathway(Thing):
-            pass
-
-        # Subclasses
-        class BusRoute(Route):
-            pass
-
-        class TramRoute(Route):
-            pass
-
-        class TrolleyRoute(Route):
-            pass
-
-        class WheelchairFriendlyTrip(Trip):
-            pass
-
-        class FastTransfer(Transfer):
-            pass
-
-        class SlowTransfer(Transfer):
-            pass
-
-        class ElevatorPathway(Pathway):
-            pass
-
-        class StairsPathway(Pathway):
-            pass
-
-        class EscalatorPathway(Pathway):
-            pass
-
-        class Walkway(Pathway):
-            pass
-
-        # Composite (DL) concepts
-        class AccessibleStop(Stop):
-            pass
-
-        class OnlyStairsAccessibleStop(Stop):
-            pass
-
-        # Object properties
-        class hasStop(ObjectProperty):
-            domain = [Trip]
-            range = [Stop]
-
-        class isStopOf(ObjectProperty):
-            domain = [Stop]
-            range = [Trip]
-            inverse_property = hasStop
-
-        class hasTrip(ObjectProperty):
-            domain = [Route]
-            range = [Trip]
-
-        class belongsToRoute(ObjectProperty):
-            domain = [Trip]
-            range = [Route]
-            inverse_property = hasTrip  # inverse
-
-        class fromStop(ObjectProperty):
-            domain = [Transfer]
-            range = [Stop]
-
-        class toStop(ObjectProperty):
-            domain = [Transfer]
-            range = [Stop]
-
-
-        # Property hierarchy (subproperty)
-        class connectsTransportElement(ObjectProperty):
-            pass
-
-        class connectsStop(ObjectProperty):
-            domain = [Pathway]
-            range = [Stop]
-
-        connectsStop.is_a.append(connectsTransportElement)
-
-        class isConnectedBy(ObjectProperty):
-            domain = [Stop]
-            range = [Pathway]
-            inverse_property = connectsStop
-
-        # Transitive relation between stops
-        class connectedTo(ObjectProperty, TransitiveProperty):
-            domain = [Stop]
-            range = [Stop]
-
-        # Data properties
-        class stopName(DataProperty, FunctionalProperty):
-            domain = [Stop]
-            range = [str]
-
-        class locationType(DataProperty, FunctionalProperty):
-            domain = [Stop]
-            range = [int]
-
-        class routeType(DataProperty, FunctionalProperty):
-            domain = [Route]
-            range = [int]
-
-        class routeShortName(DataProperty, FunctionalProperty):
-            domain = [Route]
-            range = [str]
-
-        class tripHeadsign(DataProperty, FunctionalProperty):
-            domain = [Trip]
-            range = [str]
-
-        class wheelchairAccessible(DataProperty, FunctionalProperty):
-            domain = [Trip]
-            range = [int]
-
-        class pathwayMode(DataProperty, FunctionalProperty):
-            domain = [Pathway]
-            range = [int]
-
-        class isBidirectional(DataProperty, FunctionalProperty):
-            domain = [Pathway]
-            range = [int]
-
-        class minTransferTime(DataProperty, FunctionalProperty):
-            domain = [Transfer]
-            range = [int]
-
-        #DL (Description Logic) composite concepts
-        # TramRoute ≡ Route ⊓ (routeType = 0)
-        TramRoute.equivalent_to = [
-            Route & routeType.value(0)
+        # Stops
+        stop_by_id: dict[str, Thing] = {}
+        stop_cols = ["_iri", "stop_id", "stop_name", "location_type"]
+        for iri, sid, nm, lt in stops_df[stop_cols].itertuples(index=False, name=None):
+            if not sid:
+                continue
+
+            # data properties passed as None are simply not asserted
+            stop_by_id[sid] = Stop(iri, namespace=onto, stopName=nm or None, locationType=lt)
+
+        # Routes
+        route_by_id: dict[str, Thing] = {}
+        route_cols = ["_iri", "route_id", "route_short_name", "route_type"]
+        for iri, rid, rsn, rtype in routes_df[route_cols].itertuples(index=False, name=None):
+            if not rid:
+                continue
+
+            route_by_id[rid] = Route(iri, namespace=onto, routeShortName=rsn or None, routeType=rtype)
+
+        # Trips
+        trip_by_id: dict[str, Thing] = {}
+        route_idx = pd.Index(route_by_id.keys())
+        trips_df2 = trips_df[trips_df["route_id"].isin(route_idx)]
+        trip_cols = ["_iri", "trip_id", "route_id", "trip_headsign", "wheelchair_accessible"]
+        for iri, tid, rid, hs, wa in trips_df2[trip_cols].itertuples(index=False, name=None):
+            route = route_by_id.get(rid)
+            if not tid or route is None:
+                continue
+
+            # link Trip -> Route (inverse of hasTrip)
+            trip_by_id[tid] = Trip(
+                iri, namespace=onto, belongsToRoute=[route], tripHeadsign=hs or None, wheelchairAccessible=wa
+            )
+
+        # StopTimes: connect Trips and Stops
+        # id lookups for the membership filters below, built once
+        stop_idx = pd.Index(stop_by_id.keys())
+        trip_idx = pd.Index(trip_by_id.keys())
+        # id -> individual, used to resolve whole id columns to objects in one reindex
+        stop_series = pd.Series(stop_by_id, dtype=object)
+
+        # Stream stop_times so peak memory is one chunk plus the matching rows
+        kept = []
+        for chunk in _read_csv("stop_times", MAX_STOP_TIMES, chunksize=STOP_TIMES_CHUNK):
+            for col in ("trip_id", "stop_id"):
+                chunk[col] = _str_col(chunk[col])
+            kept.append(chunk[chunk["trip_id"].isin(trip_idx) & chunk["stop_id"].isin(stop_idx)])
+
+        # a trip visiting a stop more than once (e.g. loop routes) still needs only one hasStop triple
+        stop_times_df2 = pd.concat(kept, ignore_index=True).drop_duplicates(subset=["trip_id", "stop_id"])
+        stop_times_df2 = stop_times_df2.assign(
+            _stop=stop_series.reindex(stop_times_df2["stop_id"]).to_numpy(),
+        )
+
+        # one hasStop write per trip instead of one append per stop_times row
+        for tid, stops in stop_times_df2.groupby("trip_id", sort=False)["_stop"].agg(list).items():
+            trip_by_id[tid].hasStop = stops
+
+        # stop_id -> directly connected stop_ids from transfers/pathways
+        adj: dict[str, set[str]] = defaultdict(set)
+
+        # Transfers
+        # Create transfers only if we have both stops in our stop sample (keeps ontology consistent)
+        transfers_df2 = transfers_df[
+            transfers_df["from_stop_id"].isin(stop_idx)
+            & transfers_df["to_stop_id"].isin(stop_idx)
         ]
-
-        # TrolleyRoute ≡ Route ⊓ (routeType = 3)
-        TrolleyRoute.equivalent_to = [
-            Route & routeType.value(3)
+        transfers_df2 = transfers_df2.assign(
+            _from=stop_series.reindex(transfers_df2["from_stop_id"]).to_numpy(),
+            _to=stop_series.reindex(transfers_df2["to_stop_id"]).to_numpy(),
+        )
+
+        transfer_cols = ["_iri", "from_stop_id", "to_stop_id", "_from", "_to", "min_transfer_time"]
+        for iri, fs, ts, from_s, to_s, mtt in transfers_df2[transfer_cols].itertuples(index=False, name=None):
+            if not fs or not ts:
+                continue
+
+            Transfer(iri, namespace=onto, fromStop=[from_s], toStop=[to_s], minTransferTime=mtt)
+
+            # Connect stops for reachability (transitive connectedTo)
+            adj[fs].add(ts)
+
+        # Pathways
+        # Create pathways only if both stops exist
+        pathways_df2 = pathways_df[
+            pathways_df["from_stop_id"].isin(stop_idx)
+            & pathways_df["to_stop_id"].isin(stop_idx)
         ]
+        pathways_df2 = pathways_df2.assign(
+            _from=stop_series.reindex(pathways_df2["from_stop_id"]).to_numpy(),
+            _to=stop_series.reindex(pathways_df2["to_stop_id"]).to_numpy(),
+        )
 
-        # BusRoute ≡ Route ⊓ (routeType = 11)
-        BusRoute.equivalent_to = [
-            Route & routeType.value(11)
+        pathway_cols = [
+            "_iri", "pathway_id", "from_stop_id", "to_stop_id", "_from", "_to", "pathway_mode", "is_bidirectional"
         ]
-
-        # AccessibleStop ≡ Stop ⊓ (∃ connectsStop⁻.ElevatorPathway)   (EXISTS + AND)
-        AccessibleStop.equivalent_to = [Stop & connectsStop.inverse.some(ElevatorPathway)]
-
-        # WheelchairFriendlyTrip ≡ Trip ⊓ (wheelchairAccessible = 1)
-        WheelchairFriendlyTrip.equivalent_to = [Trip & wheelchairAccessible.value(1)]
-
-        # StairsPathway ≡ Pathway ⊓ (pathwayMode = 1)
-        StairsPathway.equivalent_to = [
-            Pathway & pathwayMode.value(1)
-        ]
-
-        # EscalatorPathway ≡ Pathway ⊓ (pathwayMode = 5)
-        EscalatorPathway.equivalent_to = [
-            Pathway & pathwayMode.value(5)
-        ]
-
-        # Walkway ≡ Pathway ⊓ (pathwayMode = 2)
-        Walkway.equivalent_to = [
-            Pathway & pathwayMode.value(2)
-        ]
-
-        # FastTransfer ≡ Transfer ⊓ (minTransferTime ≤ 392) (the average transfer time)
-        FastTransfer.equivalent_to = [Transfer & minTransferTime.some(ConstrainedDatatype(int, max_inclusive=392))]
-
-
-        # SlowTransfer ≡ Transfer ⊓ (minTransferTime > 392)
-        SlowTransfer.equivalent_to = [Transfer & minTransferTime.some(ConstrainedDatatype(int, min_inclusive=393))]
-
-
-        # OnlyStairsAccessibleStop ≡ Stop ⊓ ∀ connectsStop⁻.StairsPathway
-        OnlyStairsAccessibleStop.equivalent_to = [
-            Stop & connectsStop.inverse.only(StairsPathway)
-        ]
- 
-    # Create Individuals from CSV
-    # Stops
-    stop_by_id: dict[str, Thing] = {}
-    for _, row in stops_df.iterrows():
-        sid = _safe_str(row.get("stop_id"))
-        if not sid:
-            continue
-
-        s = onto.Stop(f"stop_{sid}")
-        stop_by_id[sid] = s
-
-        nm = _safe_str(row.get("stop_name"))
-        if nm:
-            s.stopName = nm
-
-        lt = _safe_int(row.get("location_type"))
-        if lt is not None:
-            s.locationType = lt
-
-    # Routes
-    route_by_id: dict[str, Thing] = {}
-    for _, row in routes_df.iterrows():
-        rid = _safe_str(row.get("route_id"))
-        if not rid:
-            continue
-
-        r = onto.Route(f"route_{rid}")
-        route_by_id[rid] = r
-
-        rsn = _safe_str(row.get("route_short_name"))
-        if rsn:
-            r.routeShortName = rsn
-
-        rtype = _safe_int(row.get("route_type"))
-        if rtype is not None:
-            r.routeType = rtype
-
-    # Trips
-    trip_by_id: dict[str, Thing] = {}
-    trips_df2 = trips_df[trips_df["route_id"].astype(str).isin(route_by_id.keys())].copy()
-    for _, row in trips_df2.iterrows():
-        tid = _safe_str(row.get("trip_id"))
-        rid = _safe_str(row.get("route_id"))
-        if not tid or rid not in route_by_id:
-            continue
-
-        t = onto.Trip(f"trip_{tid}")
-        trip_by_id[tid] = t
-
-        # link Trip -> Route (inverse of hasTrip)
-        t.belongsToRoute.append(route_by_id[rid])
-
-        hs = _safe_str(row.get("trip_headsign"))
-        if hs:
-            t.tripHeadsign = hs
-
-        wa = _safe_int(row.get("wheelchair_accessible"))
-        if wa is not None:
-            t.wheelchairAccessible = wa
-
-    # StopTimes: connect Trips and Stops
-    stop_times_df2 = stop_times_df[
-        stop_times_df["trip_id"].astype(str).isin(trip_by_id.keys())
-        & stop_times_df["stop_id"].astype(str).isin(stop_by_id.keys())
-        ].copy()
-
-    for _, row in stop_times_df2.iterrows():
-        tid = _safe_str(row.get("trip_id"))
-        sid = _safe_str(row.get("stop_id"))
-
-        if not tid or not sid:
-            continue
-
-        trip = trip_by_id[tid]
-        stop = stop_by_id[sid]
-
-        trip.hasStop.append(stop)
-
-    # Transfers
-    # Create transfers only if we have both stops in our stop sample (keeps ontology consistent)
-    transfers_df2 = transfers_df[
-        transfers_df["from_stop_id"].astype(str).isin(stop_by_id.keys())
-        & transfers_df["to_stop_id"].astype(str).isin(stop_by_id.keys())
-    ].copy()
-
-    for i, row in transfers_df2.iterrows():
-        fs = _safe_str(row.get("from_stop_id"))
-        ts = _safe_str(row.get("to_stop_id"))
-        if not fs or not ts:
-            continue
-
-        tr = onto.Transfer(f"transfer_{fs}_{ts}_{i}")
-        tr.fromStop.append(stop_by_id[fs])
-        tr.toStop.append(stop_by_id[ts])
-
-        mtt = _safe_int(row.get("min_transfer_time"))
-        if mtt is not None:
-            tr.minTransferTime = mtt
-
-        # Connect stops for reachability (transitive connectedTo)
-        stop_by_id[fs].connectedTo.append(stop_by_id[ts])
-
-    # Pathways
-    # Create pathways only if both stops exist
-    pathways_df2 = pathways_df[
-        pathways_df["from_stop_id"].astype(str).isin(stop_by_id.keys())
-        & pathways_df["to_stop_id"].astype(str).isin(stop_by_id.keys())
-    ].copy()
-
-    for _, row in pathways_df2.iterrows():
-        pid = _safe_str(row.get("pathway_id"))
-        fs = _safe_str(row.get("from_stop_id"))
-        ts = _safe_str(row.get("to_stop_id"))
-        if not pid or not fs or not ts:
-            continue
-
-        p = onto.Pathway(f"pathway_{pid}")
-
-        # link pathway -> stops
-        p.connectsStop.append(stop_by_id[fs])
-        p.connectsStop.append(stop_by_id[ts])
-
-        pm = _safe_int(row.get("pathway_mode"))
-        if pm is not None:
-            p.pathwayMode = pm
-
-        bi = _safe_int(row.get("is_bidirectional"))
-        if bi is not None:
-            p.isBidirectional = bi
-
-        # also connect stops directly for reachability
-        stop_by_id[fs].connectedTo.append(stop_by_id[ts])
-        if bi == 1:
-            stop_by_id[ts].connectedTo.append(stop_by_id[fs])
-
-    sync_reasoner()
-
-    onto.save(file=str(OUT_FILE), format="rdfxml")
-    print(f"Saved ontology to: {OUT_FILE}")
+        for iri, pid, fs, ts, from_s, to_s, pm, bi in pathways_df2[pathway_cols].itertuples(index=False, name=None):
+            if not pid or not fs or not ts:
+                continue
+
+            # link pathway -> stops
+            Pathway(iri, namespace=onto, connectsStop=[from_s, to_s], pathwayMode=pm, isBidirectional=bi)
+
+            # also connect stops directly for reachability
+            adj[fs].add(ts)
+            if bi == 1:
+                adj[ts].add(fs)
+
+        # connectedTo is transitive in the TBox, so only the direct edges are asserted here
+        for src, dsts in adj.items():
+            stop_by_id[src].connectedTo = [stop_by_id[d] for d in sorted(dsts)]
+
+    # Inference is optional: the saved ontology keeps the DL definitions either way.
+    # With --reason, the connectedTo closure is materialized in Python (cheaper than Pellet's
+    # property-value inference, which is left off) and Pellet only infers class memberships.
+    if reason:
+        with onto:
+            for src, dsts in _reachable(adj).items():
+                stop_by_id[src].connectedTo = [stop_by_id[d] for d in sorted(dsts)]
+        sync_reasoner_pellet(world, infer_property_values=False, infer_data_property_values=False)
+
+    out_file = OUT_FILE.with_suffix(SAVE_FORMATS[fmt])
+    onto.save(file=str(out_file), format=fmt)
+    if db_file:
+        world.save()
+    print(f"Saved ontology to: {out_file}")
     print(f"Counts: Stops={len(stop_by_id)}, Routes={len(route_by_id)}, Trips={len(trip_by_id)}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Build the public transport ontology from GTFS data")
+    parser.add_argument("--reason", action="store_true", help="run the Pellet reasoner before saving")
+    parser.add_argument("--format", dest="fmt", choices=SAVE_FORMATS, default="ntriples",
+                        help="output serialization (default: ntriples)")
+    parser.add_argument("--db", dest="db_file", default=None,
+                        help="back the ontology with this SQLite file instead of memory (overwritten)")
+    args = parser.parse_args()
+    try:
+        main(reason=args.reason, fmt=args.fmt, db_file=args.db_file)
+    except ImportError as e:
+        raise SystemExit(str(e))
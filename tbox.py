@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from owlready2 import (
+    World,
+    Thing,
+    DataProperty,
+    ObjectProperty,
+    FunctionalProperty,
+    TransitiveProperty,
+    ConstrainedDatatype,
+)
+
+ONTO_IRI = "http://example.org/transport.owl"
+
+
+# Classes, properties and DL axioms are defined once per world; main() only adds individuals
+def build_tbox(world: World):
+    onto = world.get_ontology(ONTO_IRI)
+    if onto.Stop is not None:
+        # already defined in this world (e.g. a repeated main() call)
+        return onto
+
+    with onto:
+        class Stop(Thing):
+            pass
+
+        class Route(Thing):
+            pass
+
+        class Trip(Thing):
+            pass
+
+        class Transfer(Thing):
+            pass
+
+        class Pathway(Thing):
+            pass
+
+        # Subclasses
+        class BusRoute(Route):
+            pass
+
+        class TramRoute(Route):
+            pass
+
+        class TrolleyRoute(Route):
+            pass
+
+        class WheelchairFriendlyTrip(Trip):
+            pass
+
+        class FastTransfer(Transfer):
+            pass
+
+        class SlowTransfer(Transfer):
+            pass
+
+        class ElevatorPathway(Pathway):
+            pass
+
+        class StairsPathway(Pathway):
+            pass
+
+        class EscalatorPathway(Pathway):
+            pass
+
+        class Walkway(Pathway):
+            pass
+
+        # Composite (DL) concepts
+        class AccessibleStop(Stop):
+            pass
+
+        class OnlyStairsAccessibleStop(Stop):
+            pass
+
+        # Object properties
+        class hasStop(ObjectProperty):
+            domain = [Trip]
+            range = [Stop]
+
+        class isStopOf(ObjectProperty):
+            domain = [Stop]
+            range = [Trip]
+            inverse_property = hasStop
+
+        class hasTrip(ObjectProperty):
+            domain = [Route]
+            range = [Trip]
+
+        class belongsToRoute(ObjectProperty):
+            domain = [Trip]
+            range = [Route]
+            inverse_property = hasTrip  # inverse
+
+        class fromStop(ObjectProperty):
+            domain = [Transfer]
+            range = [Stop]
+
+        class toStop(ObjectProperty):
+            domain = [Transfer]
+            range = [Stop]
+
+
+        # Property hierarchy (subproperty)
+        class connectsTransportElement(ObjectProperty):
+            pass
+
+        class connectsStop(ObjectProperty):
+            domain = [Pathway]
+            range = [Stop]
+
+        connectsStop.is_a.append(connectsTransportElement)
+
+        class isConnectedBy(ObjectProperty):
+            domain = [Stop]
+            range = [Pathway]
+            inverse_property = connectsStop
+
+        # Transitive relation between stops
+        class connectedTo(ObjectProperty, TransitiveProperty):
+            domain = [Stop]
+            range = [Stop]
+
+        # Data properties
+        class stopName(DataProperty, FunctionalProperty):
+            domain = [Stop]
+            range = [str]
+
+        class locationType(DataProperty, FunctionalProperty):
+            domain = [Stop]
+            range = [int]
+
+        class routeType(DataProperty, FunctionalProperty):
+            domain = [Route]
+            range = [int]
+
+        class routeShortName(DataProperty, FunctionalProperty):
+            domain = [Route]
+            range = [str]
+
+        class tripHeadsign(DataProperty, FunctionalProperty):
+            domain = [Trip]
+            range = [str]
+
+        class wheelchairAccessible(DataProperty, FunctionalProperty):
+            domain = [Trip]
+            range = [int]
+
+        class pathwayMode(DataProperty, FunctionalProperty):
+            domain = [Pathway]
+            range = [int]
+
+        class isBidirectional(DataProperty, FunctionalProperty):
+            domain = [Pathway]
+            range = [int]
+
+        class minTransferTime(DataProperty, FunctionalProperty):
+            domain = [Transfer]
+            range = [int]
+
+        #DL (Description Logic) composite concepts
+        # TramRoute ≡ Route ⊓ (routeType = 0)
+        TramRoute.equivalent_to = [
+            Route & routeType.value(0)
+        ]
+
+        # TrolleyRoute ≡ Route ⊓ (routeType = 3)
+        TrolleyRoute.equivalent_to = [
+            Route & routeType.value(3)
+        ]
+
+        # BusRoute ≡ Route ⊓ (routeType = 11)
+        BusRoute.equivalent_to = [
+            Route & routeType.value(11)
+        ]
+
+        # AccessibleStop ≡ Stop ⊓ (∃ connectsStop⁻.ElevatorPathway)   (EXISTS + AND)
+        AccessibleStop.equivalent_to = [Stop & connectsStop.inverse.some(ElevatorPathway)]
+
+        # WheelchairFriendlyTrip ≡ Trip ⊓ (wheelchairAccessible = 1)
+        WheelchairFriendlyTrip.equivalent_to = [Trip & wheelchairAccessible.value(1)]
+
+        # StairsPathway ≡ Pathway ⊓ (pathwayMode = 1)
+        StairsPathway.equivalent_to = [
+            Pathway & pathwayMode.value(1)
+        ]
+
+        # EscalatorPathway ≡ Pathway ⊓ (pathwayMode = 5)
+        EscalatorPathway.equivalent_to = [
+            Pathway & pathwayMode.value(5)
+        ]
+
+        # Walkway ≡ Pathway ⊓ (pathwayMode = 2)
+        Walkway.equivalent_to = [
+            Pathway & pathwayMode.value(2)
+        ]
+
+        # FastTransfer ≡ Transfer ⊓ (minTransferTime ≤ 392) (the average transfer time)
+        FastTransfer.equivalent_to = [Transfer & minTransferTime.some(ConstrainedDatatype(int, max_inclusive=392))]
+
+
+        # SlowTransfer ≡ Transfer ⊓ (minTransferTime > 392)
+        SlowTransfer.equivalent_to = [Transfer & minTransferTime.some(ConstrainedDatatype(int, min_inclusive=393))]
+
+
+        # OnlyStairsAccessibleStop ≡ Stop ⊓ ∀ connectsStop⁻.StairsPathway
+        OnlyStairsAccessibleStop.equivalent_to = [
+            Stop & connectsStop.inverse.only(StairsPathway)
+        ]
+
+    return onto
@@ -1,20 +1,27 @@
+import numpy as np
 import pandas as pd
 
-def _safe_str(x) -> str:
-    if pd.isna(x):
-        return ""
-    return str(x).strip()
+def _str_col(s: pd.Series) -> pd.Series:
+    # NaN -> "", otherwise the stripped str value
+    return s.fillna("").astype(str).str.strip()
 
-def _safe_int(x, default: int | None = None) -> int | None:
-    if pd.isna(x) or x == "":
-        return default
-    try:
-        return int(x)
-    except Exception:
-        try:
-            return int(float(x))
-        except Exception:
-            return default
+def _int_col(s: pd.Series) -> pd.Series:
+    # unparsable/NaN -> None, otherwise plain Python ints (floats truncated)
+    nums = pd.to_numeric(s, errors="coerce")
+    ints = np.trunc(nums.where(np.isfinite(nums))).astype("Int64")
+    return ints.astype(object).where(ints.notna(), None)
 
-def _limit(df: pd.DataFrame, n: int | None) -> pd.DataFrame:
-    return df if (n is None or len(df) <= n) else df.head(n)
+def _reachable(adj: dict[str, set[str]]) -> dict[str, set[str]]:
+    # transitive closure of adj: iterative DFS from every source node
+    reach: dict[str, set[str]] = {}
+    for src, nbrs in adj.items():
+        seen: set[str] = set()
+        stack = list(nbrs)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(adj.get(node, ()))
+        reach[src] = seen
+    return reach